@@ -1,4 +1,7 @@
+import asyncio
 from abc import ABC
+from collections import deque
+from typing import Deque, Iterator, Optional, Tuple
 
 
 class CommunicatorBase(ABC):
@@ -10,6 +13,13 @@ class CommunicatorBase(ABC):
 
     _verbose = False
 
+    # State of the asynchronous interface. It is created on first use of send_recv.
+    _aio_loop: Optional[asyncio.AbstractEventLoop] = None
+    _aio_outgoing: Optional[Deque[Tuple[str, asyncio.Future]]] = None
+    _aio_writer: Optional[asyncio.Task] = None
+    _aio_pending: Optional[Deque[asyncio.Future]] = None
+    _aio_reader: Optional[asyncio.Task] = None
+
 
     def connect(self, address: str, encoding : str = 'utf-8') -> None:
         """Connect to the probe station.
@@ -35,9 +45,133 @@ class CommunicatorBase(ABC):
         raise NotImplementedError("CommunicatorBase.send is not implemented!")
 
 
+    def send_bytes(self, data: bytes):
+        """Send a pre-encoded command to the probe station.
+
+        This is meant for constant commands which are encoded once instead of on every call.
+        The default implementation decodes the data and passes it to send. Derived classes
+        may override it to write the data directly.
+
+        Args:
+            data (bytes): The encoded command including the terminating line break.
+        """
+        self.send(data.decode().rstrip("\n"))
+
+
     def read_line(self):
         """Read a line from the probe station.
 
         Must be implemented by the derived class.
         """
         raise NotImplementedError("CommunicatorBase.read_line is not implemented!")
+
+
+    def check_ok(self) -> None:
+        """Read the response of a command that does not return data and check it for errors.
+
+        Responses starting with "0," (no error, no status flags) are accepted without
+        parsing them. All other responses are passed to Response.check_resp.
+
+        Raises:
+            ProberException: If the response indicates an error.
+        """
+        line = self.read_line()
+        if line.startswith("0,"):
+            return
+
+        from sentio_prober_control.Sentio.Response import Response
+        Response.check_resp(line)
+
+
+    def read_line_chunked(self, chunk_size: int) -> Iterator[str]:
+        """Read a line from the probe station in chunks.
+
+        This is meant for very long responses like downloaded images which should not
+        be held in memory as a whole. The concatenation of all chunks is the line
+        including a trailing line break if the communicator delivers one.
+
+        The default implementation reads the whole line and returns it as a single chunk.
+        Derived classes may override it to read the line incrementally.
+
+        Args:
+            chunk_size (int): The maximum number of characters per chunk.
+
+        Returns:
+            An iterator over the chunks of the line.
+        """
+        yield self.read_line()
+
+
+    async def send_recv(self, msg: str) -> str:
+        """Send a command to the probe station and asynchronously wait for its response.
+
+        Commands can be issued concurrently from several tasks. Each command is sent right away
+        without waiting for the responses of previously sent commands. A single reader task reads
+        the responses and hands them to the waiting callers in the order in which the commands
+        were sent.
+
+        The blocking send and read_line functions are executed in worker threads. Do not call
+        them directly while commands issued with send_recv are still pending.
+
+        Args:
+            msg (str): The command to send.
+
+        Returns:
+            The response line.
+        """
+        loop = asyncio.get_running_loop()
+        if self._aio_loop is not loop:
+            self._aio_loop = loop
+            self._aio_outgoing = deque()
+            self._aio_writer = None
+            self._aio_pending = deque()
+            self._aio_reader = None
+
+        future = loop.create_future()
+        self._aio_outgoing.append((msg, future))
+
+        if self._aio_writer is None or self._aio_writer.done():
+            self._aio_writer = loop.create_task(self._aio_write_commands())
+
+        return await future
+
+
+    async def _aio_write_commands(self) -> None:
+        # Send queued commands one after the other. Sending happens in a task of its own so that
+        # cancelling a caller cannot interrupt it. Every command that was sent is registered
+        # for its response.
+        loop = asyncio.get_running_loop()
+        while self._aio_outgoing:
+            msg, future = self._aio_outgoing.popleft()
+            if future.done():
+                # cancelled before it was sent
+                continue
+
+            try:
+                await asyncio.to_thread(self.send, msg)
+            except Exception as exc:
+                if not future.done():
+                    future.set_exception(exc)
+                continue
+
+            self._aio_pending.append(future)
+            if self._aio_reader is None or self._aio_reader.done():
+                self._aio_reader = loop.create_task(self._aio_read_responses())
+
+
+    async def _aio_read_responses(self) -> None:
+        # Read responses as long as commands are waiting for them. Responses of cancelled
+        # commands must be read as well to keep the communication in sync.
+        while self._aio_pending:
+            try:
+                line = await asyncio.to_thread(self.read_line)
+            except Exception as exc:
+                while self._aio_pending:
+                    future = self._aio_pending.popleft()
+                    if not future.done():
+                        future.set_exception(exc)
+                return
+
+            future = self._aio_pending.popleft()
+            if not future.done():
+                future.set_result(line)
@@ -1,5 +1,6 @@
 import socket
 import locale
+from typing import Iterator
 
 from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
 
@@ -72,7 +73,19 @@ class CommunicatorTcpIp(CommunicatorBase):
         if CommunicatorBase._verbose:
             print(f'Sending "{msg}"')
 
-        self.__socket.send((msg + "\n").encode())
+        self.__socket.sendall((msg + "\n").encode())
+
+    def send_bytes(self, data: bytes):
+        """Send a pre-encoded command to the TCP/IP device.
+
+            Args:
+                data (bytes): The encoded command including the terminating line break.
+        """
+
+        if CommunicatorBase._verbose:
+            print(f'Sending "{data.decode().rstrip()}"')
+
+        self.__socket.sendall(data)
 
     def read_line(self):
         """Read a line from the TCP/IP device.
@@ -81,3 +94,22 @@ class CommunicatorTcpIp(CommunicatorBase):
                 The read line.
         """
         return self.__reader.readline().rstrip()
+
+    def read_line_chunked(self, chunk_size: int) -> Iterator[str]:
+        """Read a line from the TCP/IP device in chunks.
+
+            Args:
+                chunk_size (int): The maximum number of characters per chunk.
+
+            Returns:
+                An iterator over the chunks of the line. The last chunk contains the line break.
+        """
+        while True:
+            chunk = self.__reader.readline(chunk_size)
+            if not chunk:
+                return
+
+            yield chunk
+
+            if chunk.endswith("\n"):
+                return
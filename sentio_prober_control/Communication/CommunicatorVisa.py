@@ -52,6 +52,16 @@ class CommunicatorVisa(CommunicatorBase):
 
         self.__visa.write((msg + "\n"))
 
+    def send_bytes(self, data: bytes):
+        """Send a pre-encoded command to the VISA device.
+
+        :param data: The encoded command including the terminating line break.
+        """
+        if CommunicatorBase._verbose:
+            print('Sending "{0}"'.format(data.decode().rstrip()))
+
+        self.__visa.write_raw(data)
+
     def read_line(self):
         """Read a line from the VISA device.
 
@@ -0,0 +1,131 @@
+from typing import Any, Callable, Optional, Tuple, Union
+
+from sentio_prober_control.Sentio.Enumerations import (
+    AutoAlignCmd,
+    AutoFocusCmd,
+    CameraMountPoint,
+    DetectionAlgorithm,
+    DetectionCoordindates,
+    FindPatternReference,
+    MoveAxis,
+    PtpaFindTipsMode,
+    PtpaType,)
+from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.Sentio.CommandGroups import VisionCommands
+from sentio_prober_control.Sentio.CommandGroups.CommandGroupBase import CommandGroupBase
+
+
+class VisionAsyncCommandGroup(CommandGroupBase):
+    """Asynchronous variants of the vision functions.
+
+    You are not meant to instantiate this class directly. Access it via the aio attribute
+    of the [VisionCommandGroup](VisionCommandGroup.md) class.
+
+    The functions of this class are coroutines. Commands issued concurrently are sent
+    without waiting for the responses of previous commands (see CommunicatorBase.send_recv).
+    Independent queries can therefore be overlapped:
+
+    >>> scope, offaxis = await asyncio.gather(
+    >>>     prober.vision.aio.has_camera(CameraMountPoint.Scope),
+    >>>     prober.vision.aio.has_camera(CameraMountPoint.OffAxis))
+
+    The functions take the same arguments and return the same values as their
+    counterparts in VisionCommandGroup. They neither use nor update the camera and light
+    status cache of VisionCommandGroup.
+
+    Every function of VisionCommandGroup that sends a single remote command has an
+    asynchronous variant. Not included are snap_image, which streams a file, switch_lights_bulk
+    and detect_probetips_array, which build on the command pipeline and numpy, start_fast_track,
+    which is executed by the prober object, and the deprecated start_execute_compensation.
+    """
+
+    def __init__(self, parent: "VisionCommandGroup") -> None:
+        super().__init__(parent)
+
+    async def _execute(self, cmd: Union[str, bytes], parse: Optional[Callable[[Response], Any]] = None) -> Any:
+        # Commands given as bytes are pre-encoded constants including the line break.
+        if isinstance(cmd, bytes):
+            cmd = cmd.decode().rstrip("\n")
+
+        resp = Response.check_resp(await self.comm.send_recv(cmd))
+        return parse(resp) if parse is not None else None
+
+    async def align_wafer(self, mode: AutoAlignCmd = AutoAlignCmd.AlignOnly) -> None:
+        """Perform a wafer alignment. See VisionCommandGroup.align_wafer."""
+        return await self._execute(*VisionCommands.align_wafer(mode))
+
+    async def align_die(self, threshold: float = 0.05) -> Tuple[float, float, float]:
+        """Perform a die alignment. See VisionCommandGroup.align_die."""
+        return await self._execute(*VisionCommands.align_die(threshold))
+
+    async def auto_focus(self, af_cmd: AutoFocusCmd = AutoFocusCmd.Focus) -> Tuple[float, MoveAxis]:
+        """Perform an auto focus operation. See VisionCommandGroup.auto_focus."""
+        return await self._execute(*VisionCommands.auto_focus(af_cmd))
+
+    async def camera_synchronize(self) -> Tuple[float, float, float]:
+        """Execute the "vis:camera_synchronize" remote command. See VisionCommandGroup.camera_synchronize."""
+        return await self._execute(*VisionCommands.camera_synchronize())
+
+    async def detect_probetips(self, camera: CameraMountPoint, detector: DetectionAlgorithm = DetectionAlgorithm.ProbeDetector, coords: DetectionCoordindates = DetectionCoordindates.Roi) -> list:
+        """Execute a built in detector on a given camera. See VisionCommandGroup.detect_probetips."""
+        return await self._execute(*VisionCommands.detect_probetips(camera, detector, coords))
+
+    async def enable_follow_mode(self, stat: bool) -> None:
+        """Enable or disable the scope follow mode. See VisionCommandGroup.enable_follow_mode."""
+        return await self._execute(*VisionCommands.enable_follow_mode(stat))
+
+    async def find_home(self) -> None:
+        """Find home position. See VisionCommandGroup.find_home."""
+        return await self._execute(*VisionCommands.find_home())
+
+    async def find_pattern(self, name: str, threshold: float = 70, pattern_index: int = 0, reference: FindPatternReference = FindPatternReference.CenterOfRoi) -> Tuple[float, float, float, float]:
+        """Find a trained pattern in the camera image. See VisionCommandGroup.find_pattern."""
+        return await self._execute(*VisionCommands.find_pattern(name, threshold, pattern_index, reference))
+
+    async def find_thermal_die_size(self) -> Tuple[float, float]:
+        """Detect thermal expansion and return die size ratio. See VisionCommandGroup.find_thermal_die_size."""
+        return await self._execute(*VisionCommands.find_thermal_die_size())
+
+    async def get_lens_zoom_level(self) -> float:
+        """Get current zoom level of the lens. See VisionCommandGroup.get_lens_zoom_level."""
+        return await self._execute(*VisionCommands.get_lens_zoom_level())
+
+    async def get_light_status(self, camera: CameraMountPoint) -> bool:
+        """Check whether light is on or off for a specific camera. See VisionCommandGroup.get_light_status."""
+        return await self._execute(*VisionCommands.get_light_status(camera))
+
+    async def has_camera(self, camera: CameraMountPoint) -> bool:
+        """Check wether a given camera is present in the system. See VisionCommandGroup.has_camera."""
+        return await self._execute(*VisionCommands.has_camera(camera))
+
+    async def match_tips(self, ptpa_type: PtpaType) -> Tuple[float, float]:
+        """For internal use only! See VisionCommandGroup.match_tips."""
+        return await self._execute(*VisionCommands.match_tips(ptpa_type))
+
+    async def ptpa_find_pads(self, row: int = 0, column: int = 0) -> Tuple[float, float, float]:
+        """Execute the "vis:execute_ptpa_find_pads" remote command. See VisionCommandGroup.ptpa_find_pads."""
+        return await self._execute(*VisionCommands.ptpa_find_pads(row, column))
+
+    async def ptpa_find_tips(self, ptpa_mode: PtpaFindTipsMode) -> Tuple[float, float, float]:
+        """Execute the "vis:ptpa_find_tips" remote command. See VisionCommandGroup.ptpa_find_tips."""
+        return await self._execute(*VisionCommands.ptpa_find_tips(ptpa_mode))
+
+    async def remove_probetip_marker(self) -> None:
+        """Remove probetip marker from the camera display. See VisionCommandGroup.remove_probetip_marker."""
+        return await self._execute(*VisionCommands.remove_probetip_marker())
+
+    async def set_lens_zoom_level(self, level: float) -> None:
+        """Set lens zoom level. See VisionCommandGroup.set_lens_zoom_level."""
+        return await self._execute(*VisionCommands.set_lens_zoom_level(level))
+
+    async def switch_all_lights(self, stat: bool) -> None:
+        """Switch all camera lights on or off. See VisionCommandGroup.switch_all_lights."""
+        return await self._execute(*VisionCommands.switch_all_lights(stat))
+
+    async def switch_camera(self, camera: CameraMountPoint) -> None:
+        """Switch the camera to use for the vision module. See VisionCommandGroup.switch_camera."""
+        return await self._execute(*VisionCommands.switch_camera(camera))
+
+    async def switch_light(self, camera: CameraMountPoint, stat: bool) -> None:
+        """Switch the light of a given camera on or off. See VisionCommandGroup.switch_light."""
+        return await self._execute(*VisionCommands.switch_light(camera, stat))
@@ -1,7 +1,15 @@
 import base64
-from typing import Tuple
-
-from deprecated import deprecated
+import itertools
+import os
+import tempfile
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy is an optional dependency. It is required by detect_probetips_array.
+    np = None
 
 from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
 from sentio_prober_control.Sentio.Enumerations import (
@@ -18,15 +26,92 @@ from sentio_prober_control.Sentio.Enumerations import (
     SnapshotLocation,
     SnapshotType, MoveAxis,)
 
+from sentio_prober_control.Sentio.CommandPipeline import CommandPipeline, PipelineResult
+from sentio_prober_control.Sentio.Helper import deprecated_once
 from sentio_prober_control.Sentio.ProberBase import ProberException
 from sentio_prober_control.Sentio.Response import Response
+from sentio_prober_control.Sentio.CommandGroups import VisionCommands
 from sentio_prober_control.Sentio.CommandGroups.ModuleCommandGroupBase import ModuleCommandGroupBase
+from sentio_prober_control.Sentio.CommandGroups.VisionAsyncCommandGroup import VisionAsyncCommandGroup
 from sentio_prober_control.Sentio.CommandGroups.VisionCameraCommandGroup import VisionCameraCommandGroup
 from sentio_prober_control.Sentio.CommandGroups.VisionCompensationGroup import VisionCompensationGroup
 from sentio_prober_control.Sentio.CommandGroups.VisionIMagProCommandGroup import VisionIMagProCommandGroup
 from sentio_prober_control.Sentio.CommandGroups.VisionPatternCommandGroup import VisionPatternCommandGroup
 
 
+# The other remote commands are built by the VisionCommands module. snap_image is not
+# available in the asynchronous command group so its command is kept here.
+_CMD_SNAP_IMAGE = "vis:snap_image {0}, {1}".format
+
+# Maximum number of characters read at once when downloading a snapshot.
+_DOWNLOAD_CHUNK_SIZE = 65536
+
+# Time in seconds for which a queried light status is reused without asking SENTIO again.
+_LIGHT_STATUS_TTL = 0.1
+
+# Record layout of the detections returned by VisionCommandGroup.detect_probetips_array.
+_TIP_DTYPE = np.dtype([("x", "f8"), ("y", "f8"), ("w", "f8"), ("h", "f8"), ("q", "f8"), ("cid", "i4")]) if np is not None else None
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    # os.write may write less than requested.
+    view = memoryview(data)
+    while len(view) > 0:
+        view = view[os.write(fd, view):]
+
+
+def _download_image(fd: int, chunks: Iterator[str]) -> None:
+    # Decode a base64 encoded image response chunk by chunk and write it to a file.
+    # If anything fails the rest of the response is read. Otherwise it would be
+    # received by the next command.
+    try:
+        # The image is not read as a whole. Read until the response header (error code and
+        # command id) is complete and check it before the image data is processed.
+        head = ""
+        for chunk in chunks:
+            head += chunk
+            if head.count(",") >= 2:
+                break
+
+        stat, cmd_id, data = head.split(",", 2)
+        if not Response.parse_resp(f"{stat},{cmd_id},").ok():
+            Response.check_resp(head + "".join(chunks))
+
+        # base64 can only be decoded in groups of 4 characters so an incomplete group
+        # is carried over to the next chunk.
+        rest = ""
+        for chunk in itertools.chain((data,), chunks):
+            buf = rest + chunk.strip()
+            n = len(buf) - len(buf) % 4
+            _write_all(fd, base64.b64decode(buf[:n]))
+            rest = buf[n:]
+
+        if rest:
+            _write_all(fd, base64.b64decode(rest))
+    except Exception:
+        for _ in chunks:
+            pass
+        raise
+
+
+def _parse_probetips_array(msg: str) -> Optional["np.ndarray"]:
+    # Each detection is a space separated list of 5 or 6 values. Detections are separated by commas.
+    # If all detections have the same number of columns numpy converts the whole response in one go.
+    # This matters for detectors returning thousands of tips. Returns None if the number of columns
+    # differs between detections.
+    str_tips = msg.split(",")
+    num_col = len(str_tips[0].split())
+    values = np.array(msg.replace(",", " ").split(), dtype=np.float64)
+    if num_col not in (5, 6) or values.size != num_col * len(str_tips):
+        return None
+
+    tips = values.reshape(-1, num_col)
+    if num_col == 5:
+        tips = np.c_[tips, np.zeros(len(tips))]
+
+    return tips
+
+
 class VisionCommandGroup(ModuleCommandGroupBase):
     """This command group contains functions for working with SENTIO's vision module.
     You are not meant to instantiate this class directly. Access it via the vision attribute
@@ -36,6 +121,7 @@ class VisionCommandGroup(ModuleCommandGroupBase):
         camera (VisionCameraCommandGroup): A subgroup to provide logic for camera specific functions.
         imagpro (VisionIMagProCommandGroup): A subgroup to provide logic for IMagPro specific functions.
         compensation (VisionCompensationGroup): A subgroup to provide logic for compensation specific functions.
+        aio (VisionAsyncCommandGroup): Asynchronous variants of the vision functions.
     """
 
     def __init__(self, prober: 'SentioProber') -> None:
@@ -45,6 +131,61 @@ class VisionCommandGroup(ModuleCommandGroupBase):
         self.imagpro = VisionIMagProCommandGroup(prober)
         self.compensation = VisionCompensationGroup(prober)
         self.pattern = VisionPatternCommandGroup(prober)
+        self.aio = VisionAsyncCommandGroup(self)
+
+        self._pipeline: Optional[CommandPipeline] = None
+
+        # Camera presence does not change while SENTIO is running. Light states are only cached
+        # for a short time because they can also be changed in SENTIO's user interface.
+        self._camera_cache: Dict[CameraMountPoint, bool] = {}
+        self._light_cache: Dict[CameraMountPoint, Tuple[bool, float]] = {}
+
+    def _execute(self, cmd: Union[str, bytes], parse: Optional[Callable[[Response], Any]] = None) -> Any:
+        # Send a command and parse its response. If a pipeline is active the command is queued
+        # instead and a handle to the (future) result is returned. Commands given as bytes are
+        # pre-encoded constants including the line break.
+        if self._pipeline is not None:
+            return self._pipeline.submit(cmd.decode().rstrip("\n") if isinstance(cmd, bytes) else cmd, parse)
+
+        # self.comm is resolved through a chain of properties. Look it up only once.
+        comm = self.comm
+        if isinstance(cmd, bytes):
+            comm.send_bytes(cmd)
+        else:
+            comm.send(cmd)
+
+        # Commands without a result only need to be checked for errors.
+        if parse is None:
+            comm.check_ok()
+            return None
+
+        resp = Response.check_resp(comm.read_line())
+        return parse(resp)
+
+    def pipeline(self) -> CommandPipeline:
+        """Create a command pipeline for batching vision commands.
+
+        Use the returned object as a context manager. Inside the with block the vision functions
+        do not communicate with SENTIO. Instead they queue their command and return a
+        PipelineResult handle. When the block is left all queued commands are sent
+        in a single write and their responses are read back in order. Afterwards the results are
+        available via the result() function of the handles.
+
+        This saves one round trip per command and is useful for sequences of independent
+        commands like querying the presence or the light status of several cameras.
+
+        Functions that transfer files (snap_image) and functions that delegate to
+        other command groups are not affected by the pipeline.
+
+        >>> with prober.vision.pipeline():
+        >>>     lights = [prober.vision.get_light_status(cam) for cam in cameras]
+        >>> print([light.result() for light in lights])
+
+        Returns:
+            A CommandPipeline object.
+        """
+
+        return CommandPipeline(self, self.comm)
 
     def align_wafer(self, mode: AutoAlignCmd = AutoAlignCmd.AlignOnly) -> None:
         """Perform a wafer alignment.
@@ -56,15 +197,7 @@ class VisionCommandGroup(ModuleCommandGroupBase):
             A Response object.
         """
 
-        # Sentio before 25.1 did not accept the explicit mode parameter "alignonly". It was only implicitly used when
-        # no parameter was given. This changed in 25.1 but i have to add this special treatment for backwards 
-        # compatibility. Sentio Versions after 25.1 will work with the else branch.
-        if mode==AutoAlignCmd.AlignOnly:
-            self.comm.send(f"vis:align_wafer")
-        else:
-            self.comm.send(f"vis:align_wafer {mode.to_string()}")
-
-        Response.check_resp(self.comm.read_line())
+        return self._execute(*VisionCommands.align_wafer(mode))
 
     def align_die(self, threshold: float = 0.05) -> Tuple[float, float, float]:
         """Perform a die alignment.
@@ -79,10 +212,7 @@ class VisionCommandGroup(ModuleCommandGroupBase):
             A tuple with the x, y and theta offset in micrometer.
         """
 
-        self.comm.send(f"vis:align_die {threshold}")
-        resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1]), float(tok[2])
+        return self._execute(*VisionCommands.align_die(threshold))
 
     def auto_focus(self, af_cmd: AutoFocusCmd = AutoFocusCmd.Focus) -> tuple[float, MoveAxis]:
         """Perform an auto focus operation.
@@ -93,15 +223,10 @@ class VisionCommandGroup(ModuleCommandGroupBase):
         Returns:
             The focus height in micrometer
         """
-        resp = self.prober.send_cmd(f"vis:auto_focus {af_cmd.to_string()}")
-        tok = resp.message().split(",")
-        return float(tok[0]), MoveAxis[tok[1].capitalize()]
+        return self._execute(*VisionCommands.auto_focus(af_cmd))
 
     def camera_synchronize(self) -> Tuple[float, float, float]:
-        self.comm.send("vis:camera_synchronize")
-        resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1]), float(tok[2])
+        return self._execute(*VisionCommands.camera_synchronize())
 
     def detect_probetips(self, camera: CameraMountPoint, detector: DetectionAlgorithm = DetectionAlgorithm.ProbeDetector, coords: DetectionCoordindates = DetectionCoordindates.Roi) -> list:
         """Executes a built in detector on a given camera and return a list of detection results.
@@ -112,31 +237,53 @@ class VisionCommandGroup(ModuleCommandGroupBase):
             coords: The coordinates to use for the returned detection results.
 
         Returns:
-            A list of detected tips. Each detection result is a tuply of 6 values: x, y, width, height, score, class_id.
+            A list of detected tips. Each detection result is a tuple of 6 values: x, y, width, height, score, class_id.
+            class_id is 0 for detectors that do not report a class.
         """
 
-        self.comm.send(f"vis:detect_probetips {camera.to_string()}, {detector.to_string()}, {coords.to_string()}")
-        resp = Response.check_resp(self.comm.read_line())
-        str_tips = resp.message().split(",")
+        return self._execute(*VisionCommands.detect_probetips(camera, detector, coords))
+
+    def detect_probetips_array(self, camera: CameraMountPoint, detector: DetectionAlgorithm = DetectionAlgorithm.ProbeDetector, coords: DetectionCoordindates = DetectionCoordindates.Roi) -> "np.ndarray":
+        """Executes a built in detector on a given camera and return the detection results as a numpy array.
+
+        This function works like detect_probetips but returns a structured numpy array instead
+        of a list of lists. Each field of the array is stored contiguously so that vectorized
+        numpy operations like `tips[tips["q"] > 0.5]` or numba compiled functions like
+        sentio_prober_control.Sentio.VisionHelper.filter_tips can process the detections efficiently.
+
+        This function requires numpy to be installed.
+
+        Args:
+            camera: The camera to use for detection.
+            detector: The detection algorithm to use.
+            coords: The coordinates to use for the returned detection results.
+
+        Returns:
+            An array with one record per detected tip. The records have the fields x, y, w (width),
+            h (height), q (score) as float64 and cid (class id) as int32.
+        """
 
-        found_tips = []
-        cid : float = 0
-        for n in range(0, len(str_tips)):
-            str_tip = str_tips[n].strip().split(" ")
-            num_col = len(str_tip)
+        if np is None:
+            raise ImportError("detect_probetips_array requires numpy! Install it with \"pip install numpy\".")
 
-            x = float(str_tip[0])  # tip x position
-            y = float(str_tip[1])  # tip y position
-            w = float(str_tip[2])  # detection width
-            h = float(str_tip[3])  # detection height
-            q = float(str_tip[4])  # detection quality (meaning depends on the used detector)
+        cmd, parse_list = VisionCommands.detect_probetips(camera, detector, coords)
 
-            if num_col >= 6:
-                cid = float(str_tip[5])  # class id (only multi class detectors)
+        def parse(resp: Response) -> "np.ndarray":
+            if not resp.message().strip():
+                # nothing detected
+                return np.empty(0, dtype=_TIP_DTYPE)
 
-            found_tips.append([x, y, w, h, q, cid])
+            values = _parse_probetips_array(resp.message())
+            if values is None:
+                values = np.array(parse_list(resp), dtype=np.float64)
 
-        return found_tips
+            tips = np.empty(len(values), dtype=_TIP_DTYPE)
+            for n, name in enumerate(_TIP_DTYPE.names):
+                tips[name] = values[:, n]
+
+            return tips
+
+        return self._execute(cmd, parse)
 
     def enable_follow_mode(self, stat: bool):
         """Enable or disable the scope follow mode.
@@ -150,8 +297,7 @@ class VisionCommandGroup(ModuleCommandGroupBase):
             stat: A flag indicating whether to enable or disable the follow mode.
         """
 
-        self.comm.send("vis:enable_follow_mode {0}".format(stat))
-        Response.check_resp(self.comm.read_line())
+        return self._execute(*VisionCommands.enable_follow_mode(stat))
 
     def find_home(self):
         """Find home position.
@@ -159,8 +305,7 @@ class VisionCommandGroup(ModuleCommandGroupBase):
         This function uses a pre-trained pattern to fully automatically find the home position.
         """
 
-        self.comm.send("vis:find_home")
-        Response.check_resp(self.comm.read_line())
+        return self._execute(*VisionCommands.find_home())
 
     def find_pattern(self, name: str, threshold: float = 70, pattern_index: int = 0, reference: FindPatternReference = FindPatternReference.CenterOfRoi) -> Tuple[float, float, float, float]:
         """Find a trained pattern in the camera image.
@@ -172,16 +317,16 @@ class VisionCommandGroup(ModuleCommandGroupBase):
             reference: The reference point to use for the pattern detection.
         """
 
-        self.comm.send(f"vis:find_pattern {name}, {threshold}, {pattern_index}, {reference.to_string()}")
-        resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1]), float(tok[2]), float(tok[3])
+        return self._execute(*VisionCommands.find_pattern(name, threshold, pattern_index, reference))
 
     def has_camera(self, camera: CameraMountPoint) -> bool:
         """Check wether a given camera is present in the system.
 
         This function wraps the "vis:has_camera" remote command.
 
+        The result is cached for the lifetime of this object because the camera setup
+        does not change while SENTIO is running.
+
         Args:
             camera: The camera mount point to check.
 
@@ -189,9 +334,17 @@ class VisionCommandGroup(ModuleCommandGroupBase):
             True if the camera is present, False otherwise.
         """
 
-        self.comm.send(f"vis:has_camera {camera.to_string()}")
-        resp = Response.check_resp(self.comm.read_line())
-        return resp.message().upper() == "1"
+        if self._pipeline is None and camera in self._camera_cache:
+            return self._camera_cache[camera]
+
+        cmd, parse_flag = VisionCommands.has_camera(camera)
+
+        def parse(resp: Response) -> bool:
+            present = parse_flag(resp)
+            self._camera_cache[camera] = present
+            return present
+
+        return self._execute(cmd, parse)
 
     def switch_all_lights(self, stat: bool) -> None:
         """Switch all camera lights on or off.
@@ -205,7 +358,12 @@ class VisionCommandGroup(ModuleCommandGroupBase):
             None
         """
 
-        self.comm.send(f"vis:switch_all_lights {stat}")
+        cmd, _ = VisionCommands.switch_all_lights(stat)
+
+        def parse(resp: Response) -> None:
+            self._light_cache.clear()
+
+        return self._execute(cmd, parse)
 
     def remove_probetip_marker(self) -> None:
         """Remove probetip marker from the camera display.
@@ -214,18 +372,14 @@ class VisionCommandGroup(ModuleCommandGroupBase):
             None
         """
 
-        self.comm.send("vis:remove_probetip_marker")
-        Response.check_resp(self.comm.read_line())
+        return self._execute(*VisionCommands.remove_probetip_marker())
 
     def match_tips(self, ptpa_type: PtpaType) -> Tuple[float, float]:
         """For internal use only!
         This function is subject to change without any prior warning. MPI will not maintain backwards
         compatibility or provide support."""
 
-        self.comm.send("vis:match_tips {0}".format(ptpa_type.to_string()))
-        resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return self._execute(*VisionCommands.match_tips(ptpa_type))
 
     def snap_image(self, file: str, what: SnapshotType = SnapshotType.CameraRaw, where: SnapshotLocation = SnapshotLocation.Prober) -> None:
         """Save a snapshot of the current camera image to a file.
@@ -240,17 +394,32 @@ class VisionCommandGroup(ModuleCommandGroupBase):
             A Response object.
         """
 
+        comm = self.comm
         if where == SnapshotLocation.Local:
-            self.comm.send(f"vis:snap_image **download**, {what.to_string()}")
-            resp = Response.check_resp(self.comm.read_line())
-            jpeg_data = base64.b64decode(resp.message())
-
-            # Save the file locally
-            with open(file, "wb") as f:
-                f.write(jpeg_data)
+            # The image is downloaded to a temporary file in the target directory. It replaces the
+            # target file only if the download succeeded. The temporary file is created before the
+            # command is sent so that an invalid path is reported before SENTIO starts sending the image.
+            # The chunks are already large so the file is written without Python's buffered io layer.
+            fd, tmp = tempfile.mkstemp(prefix=os.path.basename(file) + ".", suffix=".part", dir=os.path.dirname(os.path.abspath(file)))
+            try:
+                try:
+                    comm.send(_CMD_SNAP_IMAGE("**download**", what._wire))
+                    _download_image(fd, comm.read_line_chunked(_DOWNLOAD_CHUNK_SIZE))
+                finally:
+                    os.close(fd)
+
+                # mkstemp creates files that are only accessible by their owner.
+                os.chmod(tmp, 0o644)
+                os.replace(tmp, file)
+            except Exception:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+                raise
         else:
-            self.comm.send(f"vis:snap_image {file}, {what.to_string()}")
-            Response.check_resp(self.comm.read_line())
+            comm.send(_CMD_SNAP_IMAGE(file, what._wire))
+            Response.check_resp(comm.read_line())
 
     def switch_light(self, camera: CameraMountPoint, stat: bool):
         """Switch the light of a given camera on or off.
@@ -262,8 +431,44 @@ class VisionCommandGroup(ModuleCommandGroupBase):
         Returns:
             A Response object.
         """
-        self.comm.send(f"vis:switch_light {camera.to_string()}, {stat}")
-        Response.check_resp(self.comm.read_line())
+        def update_cache(resp: Optional[Response] = None) -> None:
+            self._light_cache[camera] = (bool(stat), time.monotonic())
+
+        cmd, _ = VisionCommands.switch_light(camera, stat)
+        if self._pipeline is not None:
+            return self._execute(cmd, update_cache)
+
+        self._execute(cmd)
+        update_cache()
+
+    def switch_lights_bulk(self, states: Dict[CameraMountPoint, bool]) -> Optional[List[PipelineResult]]:
+        """Switch the lights of several cameras on or off with a single write.
+
+        The "vis:switch_light" commands for all cameras are sent at once and their responses
+        are read back afterwards. This takes a single round trip instead of one per camera.
+
+        If called inside of an active pipeline the commands are added to that pipeline instead
+        and their handles are returned. Errors are then reported by the result() function of
+        the handles.
+
+        Args:
+            states: A dictionary mapping each camera to the desired light state.
+
+        Returns:
+            None, or the handles of the queued commands if a pipeline is active.
+
+        Raises:
+            ProberException: If SENTIO reports an error for any of the cameras. All commands are executed regardless.
+        """
+
+        if self._pipeline is not None:
+            return [self.switch_light(camera, stat) for camera, stat in states.items()]
+
+        with self.pipeline():
+            handles = [self.switch_light(camera, stat) for camera, stat in states.items()]
+
+        for handle in handles:
+            handle.result()
 
     def switch_camera(self, camera: CameraMountPoint):
         """Switch the camera to use for the vision module.
@@ -275,19 +480,13 @@ class VisionCommandGroup(ModuleCommandGroupBase):
             A Response object.
         """
 
-        self.comm.send(f"vis:switch_camera {camera.to_string()}")
+        return self._execute(*VisionCommands.switch_camera(camera))
 
     def ptpa_find_pads(self, row: int = 0, column: int = 0):
-        self.comm.send("vis:execute_ptpa_find_pads {0},{1}".format(row, column))
-        resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1]), float(tok[2])
+        return self._execute(*VisionCommands.ptpa_find_pads(row, column))
 
     def ptpa_find_tips(self, ptpa_mode: PtpaFindTipsMode):
-        self.comm.send("vis:ptpa_find_tips {0}".format(ptpa_mode.to_string()))
-        resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1]), float(tok[2])
+        return self._execute(*VisionCommands.ptpa_find_tips(ptpa_mode))
 
     def start_fast_track(self) -> Response:
         """Start the fast track process as defined in SENTIO.
@@ -302,7 +501,7 @@ class VisionCommandGroup(ModuleCommandGroupBase):
 
         return self.prober.send_cmd("vis:start_fast_track")
 
-    @deprecated("use vision.compensation.start_execute(...) instead!")
+    @deprecated_once("use vision.compensation.start_execute(...) instead!")
     def start_execute_compensation(self, comp_type: DieCompensationType, comp_mode: DieCompensationMode) -> Response:
         self.comm.send("vis:compensation:start_execute {0},{1}".format(comp_type.to_string(), comp_mode.to_string()))
         resp = Response.check_resp(self.comm.read_line())
@@ -318,10 +517,7 @@ class VisionCommandGroup(ModuleCommandGroupBase):
         Returns:
             A tuple of (ThermalFactorX, ThermalFactorY)
         """
-        self.comm.send("vis:find_thermal_die_size")
-        resp = Response.check_resp(self.comm.read_line())
-        tok = resp.message().split(",")
-        return float(tok[0]), float(tok[1])
+        return self._execute(*VisionCommands.find_thermal_die_size())
 
     def get_lens_zoom_level(self) -> float:
         """ Get current zoom level of the lens. 
@@ -329,9 +525,7 @@ class VisionCommandGroup(ModuleCommandGroupBase):
             Returns:
                 float: The current zoom level of the lens.
         """
-        self.comm.send("vis:get_lens_zoom_level")
-        resp = Response.check_resp(self.comm.read_line())
-        return float(resp.message())
+        return self._execute(*VisionCommands.get_lens_zoom_level())
 
     def set_lens_zoom_level(self, level: float) -> None:
         """Set lens zoom level.
@@ -342,18 +536,30 @@ class VisionCommandGroup(ModuleCommandGroupBase):
         Returns:
             None
         """
-        self.comm.send(f"vis:set_lens_zoom_level {level}")
-        Response.check_resp(self.comm.read_line())
+        return self._execute(*VisionCommands.set_lens_zoom_level(level))
 
     def get_light_status(self, camera: CameraMountPoint) -> bool:
         """Check whether light is on or off for a specific camera.
 
+        The light status is cached for 100 ms. Switching the light with this
+        command group updates the cached value.
+
         Args:
             camera: e.g. 'scope', 'offaxis'
 
         Returns:
             True if light is ON
         """
-        self.comm.send(f"vis:get_light_status {camera.to_string()}")
-        resp = Response.check_resp(self.comm.read_line())
-        return resp.message().strip().lower() == "1"
+        if self._pipeline is None:
+            cached = self._light_cache.get(camera)
+            if cached is not None and time.monotonic() - cached[1] < _LIGHT_STATUS_TTL:
+                return cached[0]
+
+        cmd, parse_flag = VisionCommands.get_light_status(camera)
+
+        def parse(resp: Response) -> bool:
+            stat = parse_flag(resp)
+            self._light_cache[camera] = (stat, time.monotonic())
+            return stat
+
+        return self._execute(cmd, parse)
@@ -0,0 +1,213 @@
+"""Remote commands of SENTIO's vision module.
+
+The functions of this module build the command string of a vision function and the parser for
+its response. They are shared by VisionCommandGroup and VisionAsyncCommandGroup so that both
+send the same commands and return the same results. Each function returns a tuple of
+(command, parse). parse turns the Response into the result of the function. If it is None
+the command has no result and the response only needs to be checked for errors.
+
+Commands without parameters are returned as pre-encoded bytes including the line break.
+"""
+from typing import Any, Callable, Optional, Tuple, Union
+
+try:
+    from fastnumbers import float as _ff
+except ImportError:
+    # fastnumbers is an optional dependency. Its float is a faster drop-in replacement for
+    # the builtin float which is used for converting the numeric values of responses.
+    _ff = float
+
+from sentio_prober_control.Sentio.Enumerations import (
+    AutoAlignCmd,
+    AutoFocusCmd,
+    CameraMountPoint,
+    DetectionAlgorithm,
+    DetectionCoordindates,
+    FindPatternReference,
+    MoveAxis,
+    PtpaFindTipsMode,
+    PtpaType,)
+from sentio_prober_control.Sentio.ProberBase import ProberException
+from sentio_prober_control.Sentio.Response import Response
+
+Command = Tuple[Union[str, bytes], Optional[Callable[[Response], Any]]]
+
+# Bound format functions of the remote commands. They are created once at import time so that
+# issuing a command does not have to parse an f-string or format template again.
+_CMD_ALIGN_WAFER = "vis:align_wafer {0}".format
+_CMD_ALIGN_DIE = "vis:align_die {0}".format
+_CMD_AUTO_FOCUS = "vis:auto_focus {0}".format
+_CMD_DETECT_PROBETIPS = "vis:detect_probetips {0}, {1}, {2}".format
+_CMD_ENABLE_FOLLOW_MODE = "vis:enable_follow_mode {0}".format
+_CMD_FIND_PATTERN = "vis:find_pattern {0}, {1}, {2}, {3}".format
+_CMD_HAS_CAMERA = "vis:has_camera {0}".format
+_CMD_SWITCH_ALL_LIGHTS = "vis:switch_all_lights {0}".format
+_CMD_MATCH_TIPS = "vis:match_tips {0}".format
+_CMD_SWITCH_LIGHT = "vis:switch_light {0}, {1}".format
+_CMD_SWITCH_CAMERA = "vis:switch_camera {0}".format
+_CMD_PTPA_FIND_PADS = "vis:execute_ptpa_find_pads {0},{1}".format
+_CMD_PTPA_FIND_TIPS = "vis:ptpa_find_tips {0}".format
+_CMD_SET_LENS_ZOOM_LEVEL = "vis:set_lens_zoom_level {0}".format
+_CMD_GET_LIGHT_STATUS = "vis:get_light_status {0}".format
+
+# Commands without parameters are encoded once and sent as they are.
+_CMD_ALIGN_ONLY = b"vis:align_wafer\n"
+_CMD_FIND_HOME = b"vis:find_home\n"
+_CMD_REMOVE_PROBETIP_MARKER = b"vis:remove_probetip_marker\n"
+_CMD_CAMERA_SYNC = b"vis:camera_synchronize\n"
+
+# Maps the lower case axis names returned by "vis:auto_focus" to the MoveAxis enumerators.
+_AXIS_LOOKUP = {name.lower(): member for name, member in MoveAxis.__members__.items()}
+
+
+def _too_few_values(msg: str, num: int) -> ProberException:
+    return ProberException(f"Response \"{msg}\" contains fewer than {num} values!")
+
+
+# The responses are only split as far as needed. Any further values are ignored.
+def _parse_float2(resp: Response) -> Tuple[float, float]:
+    msg = resp.message()
+    tok = msg.split(",", 2)
+    if len(tok) < 2:
+        raise _too_few_values(msg, 2)
+
+    return _ff(tok[0]), _ff(tok[1])
+
+
+def _parse_float3(resp: Response) -> Tuple[float, float, float]:
+    msg = resp.message()
+    tok = msg.split(",", 3)
+    if len(tok) < 3:
+        raise _too_few_values(msg, 3)
+
+    return _ff(tok[0]), _ff(tok[1]), _ff(tok[2])
+
+
+def _parse_float4(resp: Response) -> Tuple[float, float, float, float]:
+    msg = resp.message()
+    tok = msg.split(",", 4)
+    if len(tok) < 4:
+        raise _too_few_values(msg, 4)
+
+    return _ff(tok[0]), _ff(tok[1]), _ff(tok[2]), _ff(tok[3])
+
+
+def _parse_float(resp: Response) -> float:
+    return _ff(resp.message())
+
+
+def _parse_flag(resp: Response) -> bool:
+    return resp.message().strip() == "1"
+
+
+def _parse_auto_focus(resp: Response) -> Tuple[float, MoveAxis]:
+    msg = resp.message()
+    tok = msg.split(",", 2)
+    if len(tok) < 2:
+        raise _too_few_values(msg, 2)
+
+    return _ff(tok[0]), _AXIS_LOOKUP[tok[1].strip().lower()]
+
+
+def _parse_probetips(resp: Response) -> list:
+    str_tips = resp.message().split(",")
+    found_tips = [None] * len(str_tips)
+    for n in range(0, len(str_tips)):
+        str_tip = str_tips[n].strip().split(" ")
+
+        x = _ff(str_tip[0])  # tip x position
+        y = _ff(str_tip[1])  # tip y position
+        w = _ff(str_tip[2])  # detection width
+        h = _ff(str_tip[3])  # detection height
+        q = _ff(str_tip[4])  # detection quality (meaning depends on the used detector)
+        cid = _ff(str_tip[5]) if len(str_tip) >= 6 else 0.0  # class id (only multi class detectors)
+
+        found_tips[n] = (x, y, w, h, q, cid)
+
+    return found_tips
+
+
+def align_wafer(mode: AutoAlignCmd) -> Command:
+    # Sentio before 25.1 did not accept the explicit mode parameter "alignonly". It was only implicitly used when
+    # no parameter was given. This changed in 25.1 but i have to add this special treatment for backwards
+    # compatibility. Sentio Versions after 25.1 will work with the else branch.
+    if mode == AutoAlignCmd.AlignOnly:
+        return _CMD_ALIGN_ONLY, None
+    else:
+        return _CMD_ALIGN_WAFER(mode._wire), None
+
+
+def align_die(threshold: float) -> Command:
+    return _CMD_ALIGN_DIE(threshold), _parse_float3
+
+
+def auto_focus(af_cmd: AutoFocusCmd) -> Command:
+    return _CMD_AUTO_FOCUS(af_cmd._wire), _parse_auto_focus
+
+
+def camera_synchronize() -> Command:
+    return _CMD_CAMERA_SYNC, _parse_float3
+
+
+def detect_probetips(camera: CameraMountPoint, detector: DetectionAlgorithm, coords: DetectionCoordindates) -> Command:
+    return _CMD_DETECT_PROBETIPS(camera._wire, detector._wire, coords._wire), _parse_probetips
+
+
+def enable_follow_mode(stat: bool) -> Command:
+    return _CMD_ENABLE_FOLLOW_MODE(1 if stat else 0), None
+
+
+def find_home() -> Command:
+    return _CMD_FIND_HOME, None
+
+
+def find_pattern(name: str, threshold: float, pattern_index: int, reference: FindPatternReference) -> Command:
+    return _CMD_FIND_PATTERN(name, threshold, pattern_index, reference._wire), _parse_float4
+
+
+def find_thermal_die_size() -> Command:
+    return "vis:find_thermal_die_size", _parse_float2
+
+
+def get_lens_zoom_level() -> Command:
+    return "vis:get_lens_zoom_level", _parse_float
+
+
+def get_light_status(camera: CameraMountPoint) -> Command:
+    return _CMD_GET_LIGHT_STATUS(camera._wire), _parse_flag
+
+
+def has_camera(camera: CameraMountPoint) -> Command:
+    return _CMD_HAS_CAMERA(camera._wire), _parse_flag
+
+
+def match_tips(ptpa_type: PtpaType) -> Command:
+    return _CMD_MATCH_TIPS(ptpa_type._wire), _parse_float2
+
+
+def ptpa_find_pads(row: int, column: int) -> Command:
+    return _CMD_PTPA_FIND_PADS(row, column), _parse_float3
+
+
+def ptpa_find_tips(ptpa_mode: PtpaFindTipsMode) -> Command:
+    return _CMD_PTPA_FIND_TIPS(ptpa_mode._wire), _parse_float3
+
+
+def remove_probetip_marker() -> Command:
+    return _CMD_REMOVE_PROBETIP_MARKER, None
+
+
+def set_lens_zoom_level(level: float) -> Command:
+    return _CMD_SET_LENS_ZOOM_LEVEL(level), None
+
+
+def switch_all_lights(stat: bool) -> Command:
+    return _CMD_SWITCH_ALL_LIGHTS(1 if stat else 0), None
+
+
+def switch_camera(camera: CameraMountPoint) -> Command:
+    return _CMD_SWITCH_CAMERA(camera._wire), None
+
+
+def switch_light(camera: CameraMountPoint, stat: bool) -> Command:
+    return _CMD_SWITCH_LIGHT(camera._wire, 1 if stat else 0), None
@@ -0,0 +1,146 @@
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
+from sentio_prober_control.Sentio.Response import Response
+
+
+class PipelineResult:
+    """A handle to the result of a remote command that was queued in a command pipeline.
+
+    Handles are returned by command group functions while a pipeline is active. They are
+    resolved when the pipeline is flushed. Accessing the result before that raises an exception.
+    """
+
+    def __init__(self, parse: Optional[Callable[[Response], Any]] = None) -> None:
+        self.__parse = parse
+        self.__done = False
+        self.__value = None
+        self.__error: Optional[Exception] = None
+
+
+    def _resolve(self, str_resp: str) -> None:
+        try:
+            resp = Response.check_resp(str_resp)
+            self.__value = self.__parse(resp) if self.__parse is not None else None
+        except Exception as exc:
+            self.__error = exc
+
+        self.__done = True
+
+
+    def done(self) -> bool:
+        """Returns True if the response for this command has been received.
+
+        Returns:
+            done (bool): True if the pipeline was flushed and this handle was resolved.
+        """
+        return self.__done
+
+
+    def result(self) -> Any:
+        """Returns the result of the queued command.
+
+        The result is the same value the command group function would have returned
+        when called outside of a pipeline.
+
+        Returns:
+            The parsed result of the remote command.
+
+        Raises:
+            RuntimeError: If the pipeline has not been flushed yet.
+            ProberException: If SENTIO reported an error for this command.
+        """
+        if not self.__done:
+            raise RuntimeError("The command pipeline has not been flushed yet!")
+
+        if self.__error is not None:
+            raise self.__error
+
+        return self.__value
+
+
+class CommandPipeline:
+    """Queues remote commands and sends them to SENTIO in a single write.
+
+    Outside of a pipeline every remote command costs a full round trip: the command is sent and
+    the response is awaited before the next command can be issued. A pipeline collects the commands
+    instead and sends them all at once when it is flushed. The responses are then read back in order
+    so that a sequence of N commands only costs a single round trip.
+
+    You are not meant to instantiate this class directly. Use the pipeline() function of a command group.
+
+    >>> with prober.vision.pipeline():
+    >>>     scope = prober.vision.has_camera(CameraMountPoint.Scope)
+    >>>     offaxis = prober.vision.has_camera(CameraMountPoint.OffAxis)
+    >>> print(scope.result(), offaxis.result())
+    """
+
+    def __init__(self, owner: Any, comm: CommunicatorBase) -> None:
+        """Create a new command pipeline.
+
+        Args:
+            owner: The command group that routes its commands into this pipeline while it is active.
+            comm: The communicator used for flushing the pipeline.
+        """
+        self.__owner = owner
+        self.__comm = comm
+        self.__queue: Deque[Tuple[str, PipelineResult]] = deque()
+
+
+    def __enter__(self) -> "CommandPipeline":
+        if self.__owner._pipeline is not None:
+            raise RuntimeError("A command pipeline is already active!")
+
+        self.__owner._pipeline = self
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.__owner._pipeline = None
+
+        # Commands are only sent if the block was left without an error. Otherwise the caller
+        # could not tell which of the queued commands were executed.
+        if exc_type is None:
+            self.flush()
+        else:
+            self.__queue.clear()
+
+
+    def submit(self, cmd: str, parse: Optional[Callable[[Response], Any]] = None) -> PipelineResult:
+        """Queue a remote command.
+
+        Args:
+            cmd: The remote command to queue.
+            parse: A function that turns the response into the result of the handle. If None the result is None.
+
+        Returns:
+            A handle that will be resolved when the pipeline is flushed.
+        """
+        handle = PipelineResult(parse)
+        self.__queue.append((cmd, handle))
+        return handle
+
+
+    def flush(self) -> List[PipelineResult]:
+        """Send all queued commands and read back their responses.
+
+        All responses are read even if SENTIO reports an error for one of the commands so that
+        the communication stays in sync. Errors are reported when the result of the affected
+        handle is accessed.
+
+        Returns:
+            The handles of all commands that were sent, in order of submission.
+        """
+        if len(self.__queue) == 0:
+            return []
+
+        handles = [handle for _, handle in self.__queue]
+        self.__comm.send("\n".join(cmd for cmd, _ in self.__queue))
+        self.__queue.clear()
+
+        read_line = self.__comm.read_line
+        for handle in handles:
+            handle._resolve(read_line())
+
+        return handles
@@ -2108,3 +2108,13 @@ class ZReference(Enum):
             return mapping[abbr.lower()]
         except KeyError:
             raise ValueError(f"Unknown ZReference abbreviation: {abbr}")
+
+
+# Precompute the remote command representation of enumerators which are used on hot paths of
+# the vision command group. Reading the _wire attribute avoids calling to_string() on every command.
+for _enum in (AutoAlignCmd, AutoFocusCmd, CameraMountPoint, DetectionAlgorithm, DetectionCoordindates,
+              FindPatternReference, PtpaFindTipsMode, PtpaType, SnapshotType):
+    for _member in _enum:
+        _member._wire = _member.to_string()
+
+del _enum, _member
@@ -1,6 +1,8 @@
+import functools
 import re
+import warnings
 
-from typing import List
+from typing import Callable, List, Set
 
 
 class Helper:
@@ -10,4 +12,35 @@ class Helper:
         pattern = rf'"[^"]*"|[^{escaped_delimiter}]+'
         matches = re.findall(pattern, s)
 
-        return [match.strip('"') for match in matches]
\ No newline at end of file
+        return [match.strip('"') for match in matches]
+
+
+# Functions for which deprecated_once has already issued its warning.
+_warned: Set[Callable] = set()
+
+
+def deprecated_once(reason: str) -> Callable:
+    """Mark a function as deprecated and warn only on its first call.
+
+    The deprecated decorator from the deprecated package issues a DeprecationWarning on
+    every call. For functions that scripts call frequently the warning machinery becomes
+    a bottleneck. This decorator issues the warning once per process instead.
+
+    Args:
+        reason (str): The reason for the deprecation. Appended to the warning message.
+
+    Returns:
+        The decorator.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if func not in _warned:
+                _warned.add(func)
+                warnings.warn(f"Call to deprecated function {func.__qualname__}. ({reason})", category=DeprecationWarning, stacklevel=2)
+
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
\ No newline at end of file
@@ -0,0 +1,40 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is an optional dependency. Without it the functions in this module are
+    # implemented with plain numpy.
+    njit = None
+
+
+def _score_mask_loop(scores: np.ndarray, min_score: float) -> np.ndarray:
+    mask = np.empty(scores.shape[0], dtype=np.bool_)
+    for i in range(scores.shape[0]):
+        mask[i] = scores[i] >= min_score
+
+    return mask
+
+
+def _score_mask_numpy(scores: np.ndarray, min_score: float) -> np.ndarray:
+    return scores >= min_score
+
+
+_score_mask = njit(cache=True)(_score_mask_loop) if njit is not None else _score_mask_numpy
+
+
+def filter_tips(tips: np.ndarray, min_score: float) -> np.ndarray:
+    """Select the detections with a minimum score.
+
+    This is a reference for post processing the results of
+    VisionCommandGroup.detect_probetips_array. If numba is installed the selection
+    is compiled to native code, otherwise it uses numpy.
+
+    Args:
+        tips (np.ndarray): The detections as returned by detect_probetips_array.
+        min_score (float): The minimum detection score of a tip.
+
+    Returns:
+        An array containing only the detections with a score of at least min_score.
+    """
+    return tips[_score_mask(tips["q"], min_score)]
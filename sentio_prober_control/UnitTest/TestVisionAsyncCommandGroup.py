@@ -0,0 +1,54 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+from sentio_prober_control.Sentio.ProberSentio import SentioProber
+from sentio_prober_control.Sentio.ProberBase import ProberException
+from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
+from sentio_prober_control.Sentio.Enumerations import AutoAlignCmd, CameraMountPoint, PtpaFindTipsMode
+
+
+class TestVisionAsyncCommandGroup(unittest.TestCase):
+    def setUp(self):
+        self.mock_comm = MagicMock(spec=CommunicatorTcpIp)
+        self.prober = SentioProber(self.mock_comm)
+
+    def test_has_camera(self):
+        self.mock_comm.send_recv.side_effect = ["0,0,1", "0,0,0"]
+
+        async def query():
+            return await asyncio.gather(self.prober.vision.aio.has_camera(CameraMountPoint.Scope),
+                                        self.prober.vision.aio.has_camera(CameraMountPoint.OffAxis))
+
+        self.assertEqual(asyncio.run(query()), [True, False])
+        self.mock_comm.send_recv.assert_any_call("vis:has_camera scope")
+        self.mock_comm.send_recv.assert_any_call("vis:has_camera offaxis")
+
+    def test_align_wafer_default(self):
+        self.mock_comm.send_recv.return_value = "0,0,OK"
+        asyncio.run(self.prober.vision.aio.align_wafer())
+        self.mock_comm.send_recv.assert_called_with("vis:align_wafer")
+
+    def test_align_wafer(self):
+        self.mock_comm.send_recv.return_value = "0,0,OK"
+        asyncio.run(self.prober.vision.aio.align_wafer(AutoAlignCmd.UpdateDieSize))
+        self.mock_comm.send_recv.assert_called_with("vis:align_wafer update")
+
+    def test_switch_all_lights(self):
+        self.mock_comm.send_recv.return_value = "0,0,OK"
+        asyncio.run(self.prober.vision.aio.switch_all_lights(True))
+        self.mock_comm.send_recv.assert_called_with("vis:switch_all_lights 1")
+
+    def test_ptpa_find_tips(self):
+        self.mock_comm.send_recv.return_value = "0,0,100.0,200.0,300.0"
+        result = asyncio.run(self.prober.vision.aio.ptpa_find_tips(PtpaFindTipsMode.OnAxis))
+        self.mock_comm.send_recv.assert_called_with("vis:ptpa_find_tips OnAxis")
+        self.assertEqual(result, (100.0, 200.0, 300.0))
+
+    def test_find_home_error(self):
+        self.mock_comm.send_recv.return_value = "1,0,no pattern"
+        with self.assertRaises(ProberException):
+            asyncio.run(self.prober.vision.aio.find_home())
+
+
+if __name__ == "__main__":
+    unittest.main()
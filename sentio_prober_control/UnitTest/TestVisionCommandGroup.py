@@ -1,6 +1,20 @@
+import asyncio
+import base64
+import os
+import queue
+import tempfile
+import time
 import unittest
-from unittest.mock import MagicMock
+import warnings
+from unittest.mock import MagicMock, patch
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from sentio_prober_control.Sentio.ProberSentio import SentioProber
+from sentio_prober_control.Sentio.ProberBase import ProberException
+from sentio_prober_control.Communication.CommunicatorBase import CommunicatorBase
 from sentio_prober_control.Communication.CommunicatorTcpIp import CommunicatorTcpIp
 from sentio_prober_control.Sentio.Enumerations import (
     CameraMountPoint,
@@ -23,12 +37,27 @@ class TestVisionCommandGroup(unittest.TestCase):
         self.prober.vision.align_wafer(AutoAlignCmd.UpdateDieSize)
         self.mock_comm.send.assert_called_with("vis:align_wafer update")
 
+    def test_align_wafer_default(self):
+        self.mock_comm.read_line.return_value = "0,0,OK"
+        self.prober.vision.align_wafer()
+        self.mock_comm.send_bytes.assert_called_with(b"vis:align_wafer\n")
+
     def test_align_die(self):
         self.mock_comm.read_line.return_value = "0,0,10.0,20.0,0.1"
         result = self.prober.vision.align_die()
         self.mock_comm.send.assert_called_with("vis:align_die 0.05")
         self.assertEqual(result, (10.0, 20.0, 0.1))
 
+    def test_align_die_extra_values(self):
+        self.mock_comm.read_line.return_value = "0,0,10.0,20.0,0.1,unused"
+        result = self.prober.vision.align_die()
+        self.assertEqual(result, (10.0, 20.0, 0.1))
+
+    def test_align_die_truncated(self):
+        self.mock_comm.read_line.return_value = "0,0,10.0,20.0"
+        with self.assertRaises(ProberException):
+            self.prober.vision.align_die()
+
     def test_auto_focus_default(self):
         self.mock_comm.read_line.return_value = "0,0,13500,scope"
         result = self.prober.vision.auto_focus()
@@ -41,32 +70,71 @@ class TestVisionCommandGroup(unittest.TestCase):
         self.mock_comm.send.assert_called_with("vis:auto_focus G")
         self.assertEqual(result, (46500.0, MoveAxis.Chuck))
 
+    def test_auto_focus_imagpro(self):
+        self.mock_comm.read_line.return_value = "0,0,1200, ImagPro"
+        result = self.prober.vision.auto_focus()
+        self.assertEqual(result, (1200.0, MoveAxis.Imagpro))
+
     def test_camera_synchronize(self):
         self.mock_comm.read_line.return_value = "0,0,1.1,2.2,3.3"
         result = self.prober.vision.camera_synchronize()
-        self.mock_comm.send.assert_called_with("vis:camera_synchronize")
+        self.mock_comm.send_bytes.assert_called_with(b"vis:camera_synchronize\n")
         self.assertEqual(result, (1.1, 2.2, 3.3))
 
     def test_find_home(self):
         self.mock_comm.read_line.return_value = "0,0,OK"
         self.prober.vision.find_home()
-        self.mock_comm.send.assert_called_with("vis:find_home")
+        self.mock_comm.send_bytes.assert_called_with(b"vis:find_home\n")
 
     def test_enable_follow_mode(self):
         self.mock_comm.read_line.return_value = "0,0,OK"
         self.prober.vision.enable_follow_mode(True)
-        self.mock_comm.send.assert_called_with("vis:enable_follow_mode True")
+        self.mock_comm.send.assert_called_with("vis:enable_follow_mode 1")
 
     def test_switch_all_lights(self):
         self.mock_comm.read_line.return_value = "0,0,OK"
         self.prober.vision.switch_all_lights(True)
-        self.mock_comm.send.assert_called_with("vis:switch_all_lights True")
+        self.mock_comm.send.assert_called_with("vis:switch_all_lights 1")
 
     def test_detect_probetips(self):
         self.mock_comm.read_line.return_value = "0,0,100 200 10 10 0.98 1"
         result = self.prober.vision.detect_probetips(CameraMountPoint.Scope)
         self.mock_comm.send.assert_called_with("vis:detect_probetips scope, ProbeDetector, Roi")
-        self.assertEqual(result[0][0:5], [100.0, 200.0, 10.0, 10.0, 0.98])
+        self.assertEqual(result[0][0:5], (100.0, 200.0, 10.0, 10.0, 0.98))
+
+    def test_detect_probetips_multiple(self):
+        self.mock_comm.read_line.return_value = "0,0,100 200 10 10 0.98 1, 300 400 12 14 0.5 2"
+        result = self.prober.vision.detect_probetips(CameraMountPoint.Scope)
+        self.assertEqual(result, [(100.0, 200.0, 10.0, 10.0, 0.98, 1.0), (300.0, 400.0, 12.0, 14.0, 0.5, 2.0)])
+
+    def test_detect_probetips_without_class_id(self):
+        self.mock_comm.read_line.return_value = "0,0,100 200 10 10 0.98, 300 400 12 14 0.5"
+        result = self.prober.vision.detect_probetips(CameraMountPoint.Scope)
+        self.assertEqual(result, [(100.0, 200.0, 10.0, 10.0, 0.98, 0.0), (300.0, 400.0, 12.0, 14.0, 0.5, 0.0)])
+
+    def test_detect_probetips_mixed_columns(self):
+        self.mock_comm.read_line.return_value = "0,0,100 200 10 10 0.98 3, 300 400 12 14 0.5"
+        result = self.prober.vision.detect_probetips(CameraMountPoint.Scope)
+        self.assertEqual(result, [(100.0, 200.0, 10.0, 10.0, 0.98, 3.0), (300.0, 400.0, 12.0, 14.0, 0.5, 0.0)])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_detect_probetips_array(self):
+        self.mock_comm.read_line.return_value = "0,0,100 200 10 10 0.98 1, 300 400 12 14 0.5 2"
+        result = self.prober.vision.detect_probetips_array(CameraMountPoint.Scope)
+        self.mock_comm.send.assert_called_with("vis:detect_probetips scope, ProbeDetector, Roi")
+        self.assertEqual(result.shape, (2,))
+        self.assertEqual(result[1].tolist(), (300.0, 400.0, 12.0, 14.0, 0.5, 2))
+        self.assertEqual(result["cid"].tolist(), [1, 2])
+
+        from sentio_prober_control.Sentio.VisionHelper import filter_tips
+        self.assertEqual(filter_tips(result, 0.9)["x"].tolist(), [100.0])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_detect_probetips_array_empty(self):
+        self.mock_comm.read_line.return_value = "0,0,"
+        result = self.prober.vision.detect_probetips_array(CameraMountPoint.Scope)
+        self.assertEqual(result.shape, (0,))
+        self.assertEqual(result.dtype.names, ("x", "y", "w", "h", "q", "cid"))
 
     def test_ptpa_find_tips(self):
         self.mock_comm.read_line.return_value = "0,0,100.0,200.0,300.0"
@@ -79,6 +147,68 @@ class TestVisionCommandGroup(unittest.TestCase):
         self.prober.vision.snap_image("test.jpg", SnapshotType.CameraRaw, SnapshotLocation.Prober)
         self.mock_comm.send.assert_called_with("vis:snap_image test.jpg, 0")
 
+    def test_snap_image_local(self):
+        jpeg_data = bytes(range(256)) * 3
+        encoded = base64.b64encode(jpeg_data).decode()
+        self.mock_comm.read_line_chunked.return_value = iter(["0,", "0,", encoded[:5], encoded[5:301], encoded[301:] + "\n"])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = os.path.join(tmp_dir, "test.jpg")
+            self.prober.vision.snap_image(file, SnapshotType.CameraRaw, SnapshotLocation.Local)
+            self.mock_comm.send.assert_called_with("vis:snap_image **download**, 0")
+
+            with open(file, "rb") as f:
+                self.assertEqual(f.read(), jpeg_data)
+
+            self.assertEqual(os.listdir(tmp_dir), ["test.jpg"])
+
+    def test_snap_image_local_error(self):
+        self.mock_comm.read_line_chunked.return_value = iter(["1,0,no camera", "\n"])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(ProberException):
+                self.prober.vision.snap_image(os.path.join(tmp_dir, "test.jpg"), SnapshotType.CameraRaw, SnapshotLocation.Local)
+
+            self.assertEqual(os.listdir(tmp_dir), [])
+
+    def test_snap_image_local_error_keeps_file(self):
+        self.mock_comm.read_line_chunked.return_value = iter(["1,0,camera busy", "\n"])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = os.path.join(tmp_dir, "test.jpg")
+            with open(file, "wb") as f:
+                f.write(b"previous image")
+
+            with self.assertRaises(ProberException):
+                self.prober.vision.snap_image(file, SnapshotType.CameraRaw, SnapshotLocation.Local)
+
+            with open(file, "rb") as f:
+                self.assertEqual(f.read(), b"previous image")
+
+            self.assertEqual(os.listdir(tmp_dir), ["test.jpg"])
+
+    def test_snap_image_local_invalid_data(self):
+        chunks = iter(["0,0,", "QUJD", "A===", "QUJD", "\n"])
+        self.mock_comm.read_line_chunked.return_value = chunks
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(ValueError):
+                self.prober.vision.snap_image(os.path.join(tmp_dir, "test.jpg"), SnapshotType.CameraRaw, SnapshotLocation.Local)
+
+            # the rest of the response must have been read and the incomplete file removed
+            self.assertEqual(list(chunks), [])
+            self.assertEqual(os.listdir(tmp_dir), [])
+
+    def test_snap_image_local_invalid_file(self):
+        self.mock_comm.reset_mock()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(FileNotFoundError):
+                self.prober.vision.snap_image(os.path.join(tmp_dir, "missing", "test.jpg"), SnapshotType.CameraRaw, SnapshotLocation.Local)
+
+        self.mock_comm.send.assert_not_called()
+        self.mock_comm.read_line_chunked.assert_not_called()
+
     def test_get_light_status(self):
         self.mock_comm.read_line.return_value = "0,0,1"
         result = self.prober.vision.get_light_status(CameraMountPoint.Scope)
@@ -120,10 +250,36 @@ class TestVisionCommandGroup(unittest.TestCase):
         self.mock_comm.send.assert_called_with("vis:has_camera offaxis")
         self.assertFalse(result)
 
+    def test_has_camera_cached(self):
+        self.mock_comm.read_line.return_value = "0,0,1"
+        self.prober.vision.has_camera(CameraMountPoint.Scope)
+        self.mock_comm.reset_mock()
+        self.assertTrue(self.prober.vision.has_camera(CameraMountPoint.Scope))
+        self.mock_comm.send.assert_not_called()
+
+    def test_get_light_status_cached(self):
+        self.mock_comm.read_line.return_value = "0,0,1"
+        with patch("time.monotonic", return_value=100.0):
+            self.prober.vision.get_light_status(CameraMountPoint.Scope)
+            self.mock_comm.reset_mock()
+            self.assertTrue(self.prober.vision.get_light_status(CameraMountPoint.Scope))
+            self.mock_comm.send.assert_not_called()
+
+        with patch("time.monotonic", return_value=101.0):
+            self.prober.vision.get_light_status(CameraMountPoint.Scope)
+            self.mock_comm.send.assert_called_with("vis:get_light_status scope")
+
+    def test_switch_light_updates_light_status(self):
+        self.mock_comm.read_line.return_value = "0,0,OK"
+        self.prober.vision.switch_light(CameraMountPoint.Scope, False)
+        self.mock_comm.reset_mock()
+        self.assertFalse(self.prober.vision.get_light_status(CameraMountPoint.Scope))
+        self.mock_comm.send.assert_not_called()
+
     def test_remove_probetip_marker(self):
         self.mock_comm.read_line.return_value = "0,0,OK"
         self.prober.vision.remove_probetip_marker()
-        self.mock_comm.send.assert_called_with("vis:remove_probetip_marker")
+        self.mock_comm.send_bytes.assert_called_with(b"vis:remove_probetip_marker\n")
 
     def test_match_tips(self):
         self.mock_comm.read_line.return_value = "0,0,0.123,0.456"
@@ -134,7 +290,25 @@ class TestVisionCommandGroup(unittest.TestCase):
     def test_switch_light(self):
         self.mock_comm.read_line.return_value = "0,0,OK"
         self.prober.vision.switch_light(CameraMountPoint.Scope, True)
-        self.mock_comm.send.assert_called_with("vis:switch_light scope, True")
+        self.mock_comm.send.assert_called_with("vis:switch_light scope, 1")
+
+    def test_switch_lights_bulk(self):
+        self.mock_comm.reset_mock()
+        self.mock_comm.read_line.side_effect = ["0,0,OK", "0,0,OK"]
+        self.prober.vision.switch_lights_bulk({CameraMountPoint.Scope: True, CameraMountPoint.OffAxis: False})
+        self.mock_comm.send.assert_called_once_with("vis:switch_light scope, 1\nvis:switch_light offaxis, 0")
+        self.assertEqual(self.mock_comm.read_line.call_count, 2)
+
+    def test_switch_lights_bulk_in_pipeline(self):
+        self.mock_comm.reset_mock()
+        self.mock_comm.read_line.side_effect = ["0,0,OK", "1,0,no light"]
+        with self.prober.vision.pipeline():
+            handles = self.prober.vision.switch_lights_bulk({CameraMountPoint.Scope: True, CameraMountPoint.OffAxis: False})
+
+        self.mock_comm.send.assert_called_once_with("vis:switch_light scope, 1\nvis:switch_light offaxis, 0")
+        self.assertIsNone(handles[0].result())
+        with self.assertRaises(ProberException):
+            handles[1].result()
 
     def test_switch_camera(self):
         self.mock_comm.read_line.return_value = "0,0,OK"
@@ -162,6 +336,114 @@ class TestVisionCommandGroup(unittest.TestCase):
         self.assertIsInstance(result.cmd_id(), int)  # cmd_id should be returned
         self.assertGreater(result.cmd_id(), 0, "cmd_id should be greater than 0")
 
+    def test_start_execute_compensation_warns_once(self):
+        self.mock_comm.read_line.return_value = "0,3,OK"
+        # start with no warnings issued, other tests may already have called the function
+        with patch("sentio_prober_control.Sentio.Helper._warned", set()), warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            for _ in range(3):
+                self.prober.vision.start_execute_compensation(DieCompensationType.DieAlign, DieCompensationMode.Lateral)
+
+        self.assertEqual(len([w for w in caught if issubclass(w.category, DeprecationWarning)]), 1)
+
+    def test_pipeline(self):
+        self.mock_comm.reset_mock()
+        self.mock_comm.read_line.side_effect = ["0,0,1", "0,0,0", "0,0,1.1,2.2,3.3"]
+        with self.prober.vision.pipeline():
+            scope = self.prober.vision.has_camera(CameraMountPoint.Scope)
+            offaxis = self.prober.vision.has_camera(CameraMountPoint.OffAxis)
+            sync = self.prober.vision.camera_synchronize()
+            self.assertFalse(scope.done())
+
+        self.mock_comm.send.assert_called_once_with("vis:has_camera scope\nvis:has_camera offaxis\nvis:camera_synchronize")
+        self.assertTrue(scope.result())
+        self.assertFalse(offaxis.result())
+        self.assertEqual(sync.result(), (1.1, 2.2, 3.3))
+
+    def test_pipeline_error(self):
+        self.mock_comm.reset_mock()
+        self.mock_comm.read_line.side_effect = ["0,0,1", "1,0,camera not found"]
+        with self.prober.vision.pipeline():
+            scope = self.prober.vision.has_camera(CameraMountPoint.Scope)
+            chuck = self.prober.vision.has_camera(CameraMountPoint.Chuck)
+
+        self.assertEqual(self.mock_comm.read_line.call_count, 2)
+        self.assertTrue(scope.result())
+        with self.assertRaises(ProberException):
+            chuck.result()
+
+    def test_check_ok(self):
+        class LineCommunicator(CommunicatorBase):
+            def __init__(self, line: str):
+                self.line = line
+
+            def read_line(self):
+                return self.line
+
+        LineCommunicator("0,0,OK").check_ok()
+        LineCommunicator("1024,0,OK").check_ok()
+        with self.assertRaises(ProberException):
+            LineCommunicator("1,0,error").check_ok()
+
+    def test_command_error(self):
+        # commands without a result check the response with check_ok
+        self.mock_comm.check_ok.side_effect = lambda: CommunicatorBase.check_ok(self.mock_comm)
+        self.mock_comm.read_line.return_value = "1,0,error"
+
+        with self.assertRaises(ProberException):
+            self.prober.vision.find_home()
+
+        with self.assertRaises(ProberException):
+            self.prober.vision.switch_light(CameraMountPoint.Scope, False)
+
+        # the light status must not be taken from a failed command
+        self.mock_comm.reset_mock()
+        self.mock_comm.read_line.return_value = "0,0,1"
+        self.assertTrue(self.prober.vision.get_light_status(CameraMountPoint.Scope))
+        self.mock_comm.send.assert_called_with("vis:get_light_status scope")
+
+    def test_aio_send_recv_order(self):
+        class EchoCommunicator(CommunicatorBase):
+            def __init__(self):
+                self.responses = queue.Queue()
+
+            def send(self, msg: str):
+                self.responses.put(f"0,0,{msg.split()[-1]}")
+
+            def read_line(self):
+                return self.responses.get(timeout=5)
+
+        comm = EchoCommunicator()
+
+        async def query():
+            return await asyncio.gather(*[comm.send_recv(f"vis:get_lens_zoom_level {n}") for n in range(10)])
+
+        self.assertEqual(asyncio.run(query()), [f"0,0,{n}" for n in range(10)])
+
+    def test_aio_send_recv_cancelled(self):
+        class SlowEchoCommunicator(CommunicatorBase):
+            def __init__(self):
+                self.responses = queue.Queue()
+
+            def send(self, msg: str):
+                time.sleep(0.2)
+                self.responses.put(f"0,0,{msg}")
+
+            def read_line(self):
+                return self.responses.get(timeout=5)
+
+        comm = SlowEchoCommunicator()
+
+        async def query():
+            first = asyncio.ensure_future(comm.send_recv("A"))
+            await asyncio.sleep(0.05)
+            first.cancel()
+
+            # the response to the cancelled command must not be passed to the next one
+            return await comm.send_recv("B")
+
+        self.assertEqual(asyncio.run(query()), "0,0,B")
+
 
 if __name__ == "__main__":
     unittest.main()